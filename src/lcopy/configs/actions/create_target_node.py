@@ -1,6 +1,7 @@
 import glob
 import logging
 import os
+import sys
 import typing as T
 
 from lcopy.configs.models.target_node import TargetNode
@@ -9,6 +10,11 @@ from lcopy.files.utils.normalize_path import normalize_path
 
 logger = logging.getLogger(__name__)
 
+# Cache of glob results keyed by the expanded pattern. Different labels and
+# target nodes often reference the same (source dir, pattern) pair, and each
+# glob call re-walks the directory tree.
+_glob_cache: T.Dict[str, T.List[str]] = {}
+
 
 def create_target_node(
     relative_target_dir: str,
@@ -19,6 +25,12 @@ def create_target_node(
     source_dirname = target_node_json.get("__source_dir__", "")
     assert source_dirname
 
+    # Sibling nodes share the same source directory, and target basenames
+    # such as "." recur across includes; interning collapses the duplicated
+    # strings into a single object
+    source_dirname = sys.intern(source_dirname)
+    relative_target_dir = sys.intern(relative_target_dir)
+
     # Create target node instance
     target_node = TargetNode(
         source_dirname=source_dirname,
@@ -33,8 +45,9 @@ def create_target_node(
 
     # Process each entry in the target_node_json
     for key, value in target_node_json.items():
-        # Skip special directives
-        if key.startswith("__"):
+        # Skip special directives; the slice comparison avoids a method
+        # lookup per key in this hot recursive loop
+        if key[:2] == "__":
             continue
 
         # If value is True, add to include patterns, else add to exclude patterns
@@ -44,12 +57,13 @@ def create_target_node(
             else:
                 exclude_patterns.append(key)
         elif isinstance(value, dict):
-            # This is a child node - create it with the key as relative_target_dir
-            child_node_json = dict(value)
+            # This is a child node - create it with the key as
+            # relative_target_dir. create_target_node only reads from the
+            # json, so no defensive copy is needed
             target_node.child_nodes.append(
                 create_target_node(
                     relative_target_dir=key,
-                    target_node_json=child_node_json,
+                    target_node_json=value,
                     ignore_patterns=ignore_patterns,
                 )
             )
@@ -76,9 +90,15 @@ def create_target_node(
             exclude_patterns=exclude_patterns,
         )
 
-        # Extract directories to be processed separately
-        directories = [f for f in filtered_files if os.path.isdir(f)]
-        files = [f for f in filtered_files if not os.path.isdir(f)]
+        # Extract directories to be processed separately, stat-ing each
+        # entry only once
+        directories = []
+        files = []
+        for filtered_file in filtered_files:
+            if os.path.isdir(filtered_file):
+                directories.append(filtered_file)
+            else:
+                files.append(filtered_file)
 
         # Store concrete file paths in the target node
         target_node.filenames = files
@@ -101,9 +121,19 @@ def _expand_patterns(patterns: T.List[str], source_dirname: str) -> T.List[str]:
         # Join source directory with pattern
         full_pattern = normalize_path(pattern, base_path=source_dirname)
         # Expand glob pattern
-        matching_files = [f for f in glob.glob(full_pattern, recursive=True)]
+        matching_files = _glob_cache.get(full_pattern)
+        if matching_files is None:
+            if glob.has_magic(full_pattern):
+                matching_files = glob.glob(full_pattern, recursive=True)
+            else:
+                # Literal patterns don't need a directory scan; a single
+                # lexists check decides the match
+                matching_files = [full_pattern] if os.path.lexists(full_pattern) else []
+            _glob_cache[full_pattern] = matching_files
         all_files.extend(matching_files)
-    return all_files
+    # Overlapping patterns commonly match the same file; dedupe while keeping
+    # the original order
+    return list(dict.fromkeys(all_files))
 
 
 def _handle_directories(
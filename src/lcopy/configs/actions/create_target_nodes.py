@@ -1,4 +1,6 @@
+import concurrent.futures
 import logging
+import os
 import typing as T
 
 from lcopy.configs.actions.create_target_node import create_target_node
@@ -6,27 +8,47 @@ from lcopy.configs.models.target_node import TargetNode
 
 logger = logging.getLogger(__name__)
 
+# Only dispatch to a thread pool when there are enough sibling targets to
+# amortize the pool setup cost
+_MIN_PARALLEL_TARGETS = 8
+
 
 def create_target_nodes(
     targets_json: dict,
     ignore_patterns: T.List[str],
 ) -> T.List[TargetNode]:
-    target_nodes = []
-
     if not targets_json:
         logger.debug("No files data found in config")
-        return target_nodes
-
-    for target_basename, target_node_json in targets_json.items():
-        if target_basename.startswith("__"):
-            continue
-
-        target_nodes.append(
-            create_target_node(
-                relative_target_dir=target_basename,
-                target_node_json=target_node_json,
-                ignore_patterns=ignore_patterns,
+        return []
+
+    targets = [
+        (target_basename, target_node_json)
+        for target_basename, target_node_json in targets_json.items()
+        if not target_basename.startswith("__")
+    ]
+
+    # Building a target node is I/O-bound (glob and stat calls release the
+    # GIL), so sibling subtrees can be expanded concurrently
+    if len(targets) >= _MIN_PARALLEL_TARGETS:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 4)
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda target: create_target_node(
+                        relative_target_dir=target[0],
+                        target_node_json=target[1],
+                        ignore_patterns=ignore_patterns,
+                    ),
+                    targets,
+                )
             )
-        )
 
-    return target_nodes
+    return [
+        create_target_node(
+            relative_target_dir=target_basename,
+            target_node_json=target_node_json,
+            ignore_patterns=ignore_patterns,
+        )
+        for target_basename, target_node_json in targets
+    ]
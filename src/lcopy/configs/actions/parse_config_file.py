@@ -5,6 +5,7 @@ from pathlib import Path
 import yaml
 from lcopy.configs.models.config import Config
 from lcopy.configs.models.options import Options
+from lcopy.configs.utils.load_yaml import load_yaml
 from lcopy.files.utils.normalize_path import normalize_path
 
 logger = logging.getLogger(__name__)
@@ -17,10 +18,9 @@ def parse_config_file(
     normalized_config_file = normalize_path(config_file)
     logger.info(f"Parsing config file: {normalized_config_file}")
 
-    # Read the config file
+    # Read the config file, reusing the parsed result if the file is unchanged
     try:
-        with open(normalized_config_file, "r") as f:
-            config_data = yaml.safe_load(f) or {}
+        config_data = load_yaml(normalized_config_file)
     except FileNotFoundError:
         logger.error(f"Config file not found: {normalized_config_file}")
         return None
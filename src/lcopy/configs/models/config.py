@@ -1,15 +1,14 @@
 import typing as T
-
-from dataclassy import dataclass
+from dataclasses import dataclass, field
 
 if T.TYPE_CHECKING:
     from lcopy.configs.models.options import Options
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     source_dirname: str
     targets_json: dict
     snippets_json: dict
-    sources: T.Dict[str, str] = {}
+    sources: T.Dict[str, str] = field(default_factory=dict)
     options: T.Optional["Options"] = None
@@ -1,9 +1,8 @@
 import typing as T
+from dataclasses import dataclass, field
 
-from dataclassy import dataclass
 
-
-@dataclass
+@dataclass(slots=True)
 class Options:
     destination: str = ""
     conflict: str = "skip"
@@ -11,5 +10,5 @@ class Options:
     purge: bool = False
     dry_run: bool = False
     default_ignore: bool = True
-    extra_ignore: T.List[str] = []
+    extra_ignore: T.List[str] = field(default_factory=list)
     concatenated_output_filename: T.Optional[str] = None
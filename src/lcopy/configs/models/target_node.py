@@ -1,11 +1,10 @@
 import typing as T
+from dataclasses import dataclass, field
 
-from dataclassy import dataclass
 
-
-@dataclass
+@dataclass(slots=True)
 class TargetNode:
     source_dirname: str
     relative_target_dir: str
     filenames: T.List[str]
-    child_nodes: T.List["TargetNode"] = []
+    child_nodes: T.List["TargetNode"] = field(default_factory=list)
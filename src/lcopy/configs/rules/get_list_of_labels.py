@@ -1,8 +1,10 @@
+import concurrent.futures
 import logging
 import os
 import typing as T
 
 import yaml
+from lcopy.configs.utils.load_yaml import load_yaml
 from lcopy.files.utils.normalize_path import normalize_path
 
 logger = logging.getLogger(__name__)
@@ -16,52 +18,73 @@ def get_list_of_labels(config_file: str) -> T.List[str]:
     labels = set()
     processed_files = set()
 
-    # Process the config file and collect all labels
-    _collect_labels_from_file(config_file, labels, processed_files)
+    # Walk the source graph level by level. The configs within one level are
+    # independent, so their YAML loads can be fanned out over threads; the
+    # libyaml loader releases the GIL while parsing
+    pending: T.List[T.Tuple[str, str | None]] = [(config_file, None)]
+    while pending:
+        level = []
+        for config_file, source in pending:
+            normalized_config_file = normalize_path(config_file)
+            if normalized_config_file in processed_files:
+                continue
+            processed_files.add(normalized_config_file)
+            level.append((normalized_config_file, source))
+
+        parsed = _parse_level([config_file for config_file, _ in level])
+
+        pending = []
+        for (normalized_config_file, source), config_data in zip(level, parsed):
+            if config_data is None:
+                continue
+            pending.extend(
+                _collect_labels(normalized_config_file, config_data, labels, source)
+            )
 
     logger.info(f"Found {len(labels)} unique labels across all config files")
-    return sorted(list(labels))
+    return sorted(labels)
 
 
-def _collect_labels_from_file(
-    config_file: str, labels: set, processed_files: set, source: str | None = None
-) -> None:
-    """
-    Recursively collect labels from a config file and its sources.
-    """
-    # Normalize path
-    normalized_config_file = normalize_path(config_file)
+def _parse_level(config_files: T.List[str]) -> T.List[T.Optional[dict]]:
+    if len(config_files) > 1:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(8, len(config_files))
+        ) as executor:
+            return list(executor.map(_load_config_data, config_files))
+    return [_load_config_data(config_file) for config_file in config_files]
 
-    # Skip if already processed
-    if normalized_config_file in processed_files:
-        return
 
-    # Mark as processed
-    processed_files.add(normalized_config_file)
-
-    logger.info(f"Extracting labels from config file: {normalized_config_file}")
-
-    # Check if file exists
-    if not os.path.isfile(normalized_config_file):
-        logger.error(f"Config file not found: {normalized_config_file}")
-        return
+def _load_config_data(config_file: str) -> T.Optional[dict]:
+    logger.info(f"Extracting labels from config file: {config_file}")
 
-    # Read and parse the config file
+    # Read and parse the config file through the shared cache, so a config
+    # that was already parsed for the copy command is not parsed again
     try:
-        with open(normalized_config_file, "r") as f:
-            config_data = yaml.safe_load(f) or {}
+        return load_yaml(config_file)
+    except FileNotFoundError:
+        logger.error(f"Config file not found: {config_file}")
+        return None
     except yaml.YAMLError as e:
         logger.error(f"Error parsing config file: {e}")
-        return
+        return None
+
 
+def _collect_labels(
+    config_file: str, config_data: dict, labels: set, source: str | None
+) -> T.List[T.Tuple[str, str]]:
+    """
+    Collect labels from a parsed config file and return the source config
+    files it refers to.
+    """
     # Extract labels from files section
     files_data = config_data.get("files", {})
     _extract_labels_from_json(files_data, labels, source=source)
 
     # Process sources section to find more labels
+    source_config_files = []
     sources_data = config_data.get("sources", {})
     if sources_data:
-        source_dirname = os.path.dirname(normalized_config_file)
+        source_dirname = os.path.dirname(config_file)
         for source_path, source in sources_data.items():
             # Get absolute path to source
             source_abs_path = normalize_path(source_path, base_path=source_dirname)
@@ -70,32 +93,43 @@ def _collect_labels_from_file(
             source_config_file = os.path.join(source_abs_path, ".lcopy.yaml")
 
             if os.path.isfile(source_config_file):
-                # Recursively collect labels from the source config file
-                _collect_labels_from_file(
-                    source_config_file, labels, processed_files, source=source
-                )
+                source_config_files.append((source_config_file, source))
+
+    return source_config_files
 
 
 def _extract_labels_from_json(
     json_data: dict, labels: set, source: str | None = None
 ) -> None:
     """
-    Recursively extract labels from __labels__ directives in the JSON structure.
+    Extract labels from __labels__ directives in the JSON structure.
+
+    The tree is walked with an explicit stack instead of recursion, which
+    avoids per-level frame overhead and recursion limits on deep configs.
     """
     if not isinstance(json_data, dict):
         return
 
     prefix = f"{source}." if source else ""
 
-    # Check for __labels__ directive at this level
-    node_labels = json_data.get("__labels__", [])
-    if node_labels:
-        if isinstance(node_labels, str):
-            labels.add(prefix + node_labels)
-        elif isinstance(node_labels, list):
-            labels.update((prefix + l) for l in node_labels)
-
-    # Recursively process child nodes
-    for key, value in json_data.items():
-        if isinstance(value, dict) and not key.startswith("__"):
-            _extract_labels_from_json(value, labels, source=source)
+    stack = [json_data]
+    while stack:
+        node = stack.pop()
+
+        # Check for __labels__ directive at this level
+        node_labels = node.get("__labels__", [])
+        if node_labels:
+            if isinstance(node_labels, str):
+                labels.add(prefix + node_labels)
+            elif isinstance(node_labels, list):
+                if prefix:
+                    labels.update((prefix + l) for l in node_labels)
+                else:
+                    # Without a prefix the whole list can be absorbed in one
+                    # C-level update
+                    labels.update(node_labels)
+
+        # Queue child nodes
+        for key, value in node.items():
+            if isinstance(value, dict) and not key.startswith("__"):
+                stack.append(value)
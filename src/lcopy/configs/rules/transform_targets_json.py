@@ -1,9 +1,10 @@
-import json
+import concurrent.futures
+import copy
+import functools
 import logging
 import os
 import typing as T
 from collections import defaultdict
-from pathlib import Path
 
 from lcopy.configs.actions.parse_config_file import parse_config_file
 
@@ -16,10 +17,13 @@ def transform_targets_json(
     source_dirname: str,
     sources: T.Dict[str, str],
     labels: T.List[str],
-    skip_list: T.List[str] | None = None,
+    skip_list: T.FrozenSet[str] | None = None,
 ) -> dict:
     if skip_list is None:
-        skip_list = []
+        skip_list = frozenset()
+
+    # Convert once so the per-node label membership tests below are O(1)
+    labels = frozenset(labels)
 
     transformed: T.Dict = _deep_copy(targets_json)
     if "__source_dir__" not in transformed:
@@ -43,7 +47,7 @@ def _transform_target_node_json(
     source_dirname: str,
     sources: T.Dict[str, str],
     labels: T.List[str],
-    skip_list: T.List[str],
+    skip_list: T.FrozenSet[str],
 ) -> dict:
     # Create a copy to avoid modifying the original
     transformed = _deep_copy(target_node_json)
@@ -57,7 +61,10 @@ def _transform_target_node_json(
         for snippet in snippets:
             if snippet in snippets_json:
                 snippet_json = snippets_json[snippet]
-                transformed.update(_deep_copy(snippet_json))
+                # Merging shared references is safe: transformed itself is a
+                # private copy, and child dicts are copied before they are
+                # mutated in _transform_target_node_json
+                transformed.update(snippet_json)
             else:
                 logger.warning(f"Snippet '{snippet}' not found in snippets JSON")
 
@@ -78,7 +85,9 @@ def _transform_target_node_json(
 
 
 def _deep_copy(snippet_json):
-    return json.loads(json.dumps(snippet_json))
+    # copy.deepcopy walks the parsed structure directly instead of encoding
+    # it to a JSON string and parsing it back
+    return copy.deepcopy(snippet_json)
 
 
 def _process_includes(sources, skip_list, transformed):
@@ -92,11 +101,33 @@ def _process_includes(sources, skip_list, transformed):
             includes, skip_list, sources
         )
         transformed["__include__"] = []
-        for source_alias, include_labels in labels_by_source_alias.items():
+
+        # Parse the source config files up front; parsing is I/O-bound, so
+        # when there are several sources it is fanned out over threads. The
+        # transform step below stays serial because it mutates shared state.
+        source_aliases = list(labels_by_source_alias)
+        source_config_files = []
+        for source_alias in source_aliases:
             assert source_alias in sources
+            source_config_files.append(f"{sources[source_alias]}/.lcopy.yaml")
+
+        if len(source_config_files) > 1:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(8, len(source_config_files))
+            ) as executor:
+                source_config_objs = list(
+                    executor.map(parse_config_file, source_config_files)
+                )
+        else:
+            source_config_objs = [
+                parse_config_file(config_file=f) for f in source_config_files
+            ]
+
+        for source_alias, source_config_obj in zip(
+            source_aliases, source_config_objs
+        ):
+            include_labels = labels_by_source_alias[source_alias]
             source_path = sources[source_alias]
-            source_config_file = f"{source_path}/.lcopy.yaml"
-            source_config_obj = parse_config_file(config_file=source_config_file)
 
             if not source_config_obj:
                 logger.warning(
@@ -111,10 +142,8 @@ def _process_includes(sources, skip_list, transformed):
                 sources=source_config_obj.sources,
                 source_dirname=source_path,
                 labels=include_labels,
-                skip_list=[
-                    *skip_list,
-                    *[f"{source_alias}.{label}" for label in include_labels],
-                ],
+                skip_list=skip_list
+                | {f"{source_alias}.{label}" for label in include_labels},
             )
             transformed["__include__"].append(source_transformed)
 
@@ -135,7 +164,7 @@ def _process_child_nodes(
 
             # Skip if labels don't match
             node_labels = value.get("__labels__", [])
-            if node_labels and not any(label in labels for label in node_labels):
+            if node_labels and labels.isdisjoint(node_labels):
                 logger.debug(
                     f"Skipping target '{key}' - labels {node_labels} not in requested labels {labels}"
                 )
@@ -148,10 +177,11 @@ def _process_child_nodes(
             )
 
             for target_basename, cd in target_basenames:
-                target_node_json = _deep_copy(value)
+                # _transform_target_node_json copies its input before
+                # mutating it, so value can be passed as-is
                 transformed[target_basename] = _transform_target_node_json(
                     snippets_json=snippets_json,
-                    target_node_json=target_node_json,
+                    target_node_json=value,
                     source_dirname=os.path.join(next_source_dirname, cd or ""),
                     sources=sources,
                     labels=labels,
@@ -161,16 +191,17 @@ def _process_child_nodes(
 
 def _handle_parentheses(transformed, key, next_source_dirname):
     target_basenames = []
-    if key.startswith("(") and key.endswith(")"):
+    # Slice comparisons instead of startswith/endswith: this check runs for
+    # every key in the target tree and slicing skips the method dispatch
+    if key[:1] == "(" and key[-1:] == ")":
         del transformed[key]
         target_basename = key[1:-1]  # Remove parentheses
 
-        if target_basename.startswith("<") and target_basename.endswith(">"):
+        if target_basename[:1] == "<" and target_basename[-1:] == ">":
             # If it starts with < and ends with >, then find all directories in source_dirname
             # and add them to the target_basenames
-            for path in Path(next_source_dirname).iterdir():
-                if path.is_dir():
-                    target_basenames.append((path.name, path.name))
+            for name in _list_subdirectories(next_source_dirname):
+                target_basenames.append((name, name))
         else:
             target_basenames.append((target_basename, target_basename))
     else:
@@ -178,8 +209,17 @@ def _handle_parentheses(transformed, key, next_source_dirname):
     return target_basenames
 
 
+@functools.lru_cache(maxsize=256)
+def _list_subdirectories(dirname: str) -> T.Tuple[str, ...]:
+    # Several (<...>) keys may expand against the same source directory;
+    # one scandir pass per directory classifies entries from the cached
+    # dirent type instead of a stat call per entry
+    with os.scandir(dirname) as it:
+        return tuple(entry.name for entry in it if entry.is_dir())
+
+
 def _get_labels_by_source_alias(
-    includes: T.List[str], skip_list: T.List[str], sources: T.Dict[str, str]
+    includes: T.List[str], skip_list: T.FrozenSet[str], sources: T.Dict[str, str]
 ):
     """
     Get labels by source alias from the includes list.
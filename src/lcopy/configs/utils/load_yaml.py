@@ -0,0 +1,59 @@
+import functools
+import logging
+import os
+import pickle
+import typing as T
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Use the libyaml-based loader when it is available; it is several times
+# faster than the pure-Python SafeLoader
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+if _YamlLoader is yaml.SafeLoader:
+    logging.getLogger(__name__).debug(
+        "libyaml is not available; falling back to the pure-Python YAML loader"
+    )
+
+
+def load_yaml(config_file: str) -> dict:
+    """
+    Load a YAML config file, reusing the parsed result if the file is
+    unchanged. Raises FileNotFoundError or yaml.YAMLError on failure.
+    """
+    stat = os.stat(config_file)
+    return _load_yaml_cached(config_file, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_yaml_cached(config_file: str, mtime_ns: int, size: int) -> dict:
+    # The mtime_ns and size arguments are only part of the cache key, so that
+    # a config file that changed on disk is parsed again.
+    config_data = _read_pickle_sidecar(config_file, mtime_ns)
+    if config_data is None:
+        with open(config_file, "rb") as f:
+            config_data = yaml.load(f.read(), Loader=_YamlLoader) or {}
+        _write_pickle_sidecar(config_file, config_data)
+    return config_data
+
+
+def _read_pickle_sidecar(config_file: str, mtime_ns: int) -> T.Optional[dict]:
+    cache_file = config_file + ".cache"
+    try:
+        if os.stat(cache_file).st_mtime_ns < mtime_ns:
+            return None
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        return None
+
+
+def _write_pickle_sidecar(config_file: str, config_data: dict) -> None:
+    cache_file = config_file + ".cache"
+    try:
+        with open(cache_file, "wb") as f:
+            pickle.dump(config_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        # The config file may live in a read-only tree
+        logger.debug(f"Could not write config cache file: {cache_file}")
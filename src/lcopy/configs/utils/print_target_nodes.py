@@ -1,8 +1,20 @@
 import json
-
-from dataclassy import asdict
+import sys
 
 
 def print_target_nodes(target_nodes):
-    for t in target_nodes:
-        print(json.dumps(asdict(t), indent=2))
+    # Encode all nodes into one JSON document and write it in a single call
+    # instead of one encode + flush per node
+    output = json.dumps([_node_to_dict(t) for t in target_nodes], indent=2)
+    sys.stdout.write(output + "\n")
+
+
+def _node_to_dict(target_node) -> dict:
+    # dataclasses.asdict reflects over the fields and deep-copies every leaf
+    # on each call; the node shape is fixed, so build the dict directly
+    return dict(
+        source_dirname=target_node.source_dirname,
+        relative_target_dir=target_node.relative_target_dir,
+        filenames=target_node.filenames,
+        child_nodes=[_node_to_dict(child) for child in target_node.child_nodes],
+    )
@@ -1,3 +1,5 @@
+import concurrent.futures
+import errno
 import logging
 import os
 import shutil
@@ -14,6 +16,7 @@ def copy_files(
     target_nodes: T.List[TargetNode],
     overwrite: str = "skip",
     dry_run: bool = False,
+    workers: int = 1,
 ) -> T.List[str]:
     copied_files = []
 
@@ -35,15 +38,35 @@ def copy_files(
     elif dry_run and not os.path.exists(destination):
         logger.info(f"Would create destination directory: {destination}")
 
-    # Process each target node
-    for target_node in target_nodes:
-        _process_target_node(
+    # Stream the (source, destination) pairs to copy; the generator walks the
+    # target node tree lazily so copying overlaps with directory traversal
+    copy_jobs = (
+        job
+        for target_node in target_nodes
+        for job in _iter_copy_jobs(
             target_node=target_node,
             destination=destination,
-            copied_files=copied_files,
-            overwrite=overwrite,
             dry_run=dry_run,
         )
+    )
+
+    # Copy the files. The prompt strategy needs user input, so it always runs
+    # serially; otherwise the copies are dispatched to a thread pool.
+    if workers > 1 and overwrite != "prompt":
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    _copy_file, src_file, dest_file, overwrite, dry_run
+                ): dest_file
+                for src_file, dest_file in copy_jobs
+            }
+            for future in concurrent.futures.as_completed(futures):
+                if future.result():
+                    copied_files.append(futures[future])
+    else:
+        for src_file, dest_file in copy_jobs:
+            if _copy_file(src_file, dest_file, overwrite, dry_run):
+                copied_files.append(dest_file)
 
     action_verb = "Would copy" if dry_run else "Copied"
     logger.info(f"{action_verb} {len(copied_files)} files to {destination}")
@@ -51,13 +74,11 @@ def copy_files(
     return sorted(copied_files)
 
 
-def _process_target_node(
+def _iter_copy_jobs(
     target_node: TargetNode,
     destination: str,
-    copied_files: T.List[str],
-    overwrite: str,
     dry_run: bool,
-) -> None:
+) -> T.Iterator[T.Tuple[str, str]]:
     # Create target directory path based on relative_target_dir
     target_dir = destination
     if target_node.relative_target_dir:
@@ -70,7 +91,7 @@ def _process_target_node(
     elif dry_run and not os.path.exists(target_dir):
         logger.info(f"Would create directory: {target_dir}")
 
-    # Copy each file
+    # Collect each file
     for src_file in target_node.filenames:
         # Normalize the source file path to handle any potential issues
         src_file = normalize_path(src_file)
@@ -84,18 +105,13 @@ def _process_target_node(
         basename = os.path.basename(src_file)
         dest_file = normalize_path(basename, base_path=target_dir)
 
-        # Copy the file
-        if _copy_file(src_file, dest_file, overwrite, dry_run):
-            # Track the copied file
-            copied_files.append(dest_file)
+        yield src_file, dest_file
 
     # Process child nodes
     for child_node in target_node.child_nodes:
-        _process_target_node(
+        yield from _iter_copy_jobs(
             target_node=child_node,
             destination=target_dir,
-            copied_files=copied_files,
-            overwrite=overwrite,
             dry_run=dry_run,
         )
 
@@ -127,19 +143,12 @@ def _copy_file(src_file: str, dest_file: str, overwrite: str, dry_run: bool) ->
                 )
                 return False
 
-    # Create parent directories if needed
-    dest_dir = os.path.dirname(dest_file)
-    if not dry_run and not os.path.exists(dest_dir):
-        logger.debug(f"Creating directory: {dest_dir}")
-        os.makedirs(dest_dir, exist_ok=True)
-    elif dry_run and not os.path.exists(dest_dir):
-        logger.debug(f"Would create directory: {dest_dir}")
-
-    # Copy the file
+    # Copy the file; the parent directory was already created once per target
+    # node by _iter_copy_jobs
     if not dry_run:
         try:
             logger.info(f"Copying file: {src_file} -> {dest_file}")
-            shutil.copy2(src_file, dest_file)
+            _copy_file_contents(src_file, dest_file)
             return True
         except (IOError, OSError) as e:
             logger.error(f"Error copying file {src_file} to {dest_file}: {e}")
@@ -147,3 +156,45 @@ def _copy_file(src_file: str, dest_file: str, overwrite: str, dry_run: bool) ->
     else:
         logger.info(f"Would copy file: {src_file} -> {dest_file}")
         return True
+
+
+def _copy_file_contents(src_file: str, dest_file: str) -> None:
+    # Prefer os.copy_file_range, which copies entirely in kernel space and can
+    # reflink on filesystems that support it. Fall back to shutil.copy2 when
+    # the syscall is unavailable or the filesystems don't support it.
+    if hasattr(os, "copy_file_range"):
+        try:
+            _copy_file_range(src_file, dest_file)
+            shutil.copystat(src_file, dest_file)
+            return
+        except OSError as e:
+            if e.errno not in (
+                errno.EXDEV,
+                errno.ENOSYS,
+                errno.EINVAL,
+                errno.EOPNOTSUPP,
+            ):
+                raise
+            logger.debug(
+                f"copy_file_range not supported for {src_file}, "
+                "falling back to shutil.copy2"
+            )
+
+    shutil.copy2(src_file, dest_file)
+
+
+def _copy_file_range(src_file: str, dest_file: str) -> None:
+    src_fd = os.open(src_file, os.O_RDONLY)
+    try:
+        remaining = os.fstat(src_fd).st_size
+        dest_fd = os.open(dest_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dest_fd, remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        finally:
+            os.close(dest_fd)
+    finally:
+        os.close(src_fd)
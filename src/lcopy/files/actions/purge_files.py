@@ -27,34 +27,42 @@ def purge_files(
     # Create a set of normalized paths to keep for faster lookups
     files_to_keep_set = set(normalize_path(path) for path in files_to_keep)
 
-    # Walk the destination directory in bottom-up order (to handle directories properly)
-    for root, dirs, files in os.walk(destination, topdown=False):
-        # Process files
-        for file in files:
-            file_path = os.path.join(root, file)
-            normalized_path = normalize_path(file_path)
+    # Purge the destination directory bottom-up (to handle directories
+    # properly)
+    _purge_directory(destination, files_to_keep_set, dry_run)
 
-            if normalized_path not in files_to_keep_set:
+
+def _purge_directory(
+    dirname: str, files_to_keep_set: T.Set[str], dry_run: bool
+) -> None:
+    # A recursive os.scandir traversal classifies entries from the dirent
+    # type, which avoids the per-entry stat call that os.walk makes
+    with os.scandir(dirname) as it:
+        entries = list(it)
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            # Purge the child directory first, then remove it if it is empty
+            _purge_directory(entry.path, files_to_keep_set, dry_run)
+
+            if not os.listdir(entry.path):
                 if not dry_run:
                     try:
-                        logger.info(f"Removing file: {file_path}")
-                        os.remove(file_path)
+                        logger.info(f"Removing empty directory: {entry.path}")
+                        os.rmdir(entry.path)
                     except OSError as e:
-                        logger.error(f"Error removing file {file_path}: {e}")
+                        logger.error(f"Error removing directory {entry.path}: {e}")
                 else:
-                    logger.info(f"Would remove file: {file_path}")
-
-        # Process directories (only empty ones)
-        for dir_name in dirs:
-            dir_path = os.path.join(root, dir_name)
+                    logger.info(f"Would remove empty directory: {entry.path}")
+        else:
+            normalized_path = normalize_path(entry.path)
 
-            # Check if directory is empty
-            if not os.listdir(dir_path):
+            if normalized_path not in files_to_keep_set:
                 if not dry_run:
                     try:
-                        logger.info(f"Removing empty directory: {dir_path}")
-                        os.rmdir(dir_path)
+                        logger.info(f"Removing file: {entry.path}")
+                        os.remove(entry.path)
                     except OSError as e:
-                        logger.error(f"Error removing directory {dir_path}: {e}")
+                        logger.error(f"Error removing file {entry.path}: {e}")
                 else:
-                    logger.info(f"Would remove empty directory: {dir_path}")
+                    logger.info(f"Would remove file: {entry.path}")
@@ -1,6 +1,8 @@
 import fnmatch
+import functools
 import logging
 import os
+import re
 import typing as T
 
 from lcopy.files.utils.normalize_path import normalize_path
@@ -17,83 +19,102 @@ def get_filtered_files(
     if not files:
         return []
 
-    filtered_files = list(files)
-
-    # Filter out excluded files
-    if exclude_patterns:
-        filtered_files = _filter_by_exclude_patterns(
-            filtered_files, source_dirname, exclude_patterns
-        )
-
-    # Filter out ignored files
-    if ignore_patterns:
-        filtered_files = _filter_by_ignore_patterns(filtered_files, ignore_patterns)
-
-    logger.debug(f"Filtered {len(files)} files to {len(filtered_files)} files")
-    return [normalize_path(f) for f in filtered_files]
-
-
-def _filter_by_exclude_patterns(
-    files: T.List[str], source_dirname: str, exclude_patterns: T.List[str]
-) -> T.List[str]:
-    result = []
+    exclude_regex = (
+        _compile_patterns(tuple(exclude_patterns)) if exclude_patterns else None
+    )
+    ignore_matchers = (
+        _classify_ignore_patterns(tuple(ignore_patterns)) if ignore_patterns else None
+    )
+    source_prefix = source_dirname.rstrip(os.sep) + os.sep
 
+    # Apply the exclude and ignore filters in a single pass over the files
+    filtered_files = []
     for file_path in files:
-        # Get the path relative to source_dirname
-        rel_path = os.path.relpath(file_path, source_dirname)
-
-        # Check if the file matches any exclude pattern
-        exclude = False
-        for pattern in exclude_patterns:
-            # Make pattern relative to source_dirname
-            if fnmatch.fnmatch(rel_path, pattern):
-                logger.debug(f"Excluding {file_path} (matches pattern '{pattern}')")
-                exclude = True
-                break
+        if exclude_regex is not None:
+            # Get the path relative to source_dirname. Almost all files live
+            # below the source directory, so a string slice replaces the much
+            # more expensive os.path.relpath call
+            if file_path.startswith(source_prefix):
+                rel_path = file_path[len(source_prefix):]
+            else:
+                rel_path = os.path.relpath(file_path, source_dirname)
+
+            if exclude_regex.match(rel_path):
+                logger.debug(f"Excluding {file_path} (matches an exclude pattern)")
+                continue
+
+        if ignore_matchers is not None and _matches_ignore_patterns(
+            file_path, ignore_matchers
+        ):
+            logger.debug(f"Ignoring {file_path} (matches an ignore pattern)")
+            continue
+
+        filtered_files.append(normalize_path(file_path))
 
-        if not exclude:
-            result.append(file_path)
-
-    return result
-
-
-def _filter_by_ignore_patterns(
-    files: T.List[str], ignore_patterns: T.List[str]
-) -> T.List[str]:
-    result = []
-
-    for file_path in files:
-        # Check if the file matches any ignore pattern
-        ignore = False
-        for pattern in ignore_patterns:
-            if _matches_ignore_pattern(file_path, pattern):
-                logger.debug(f"Ignoring {file_path} (matches pattern '{pattern}')")
-                ignore = True
-                break
-
-        if not ignore:
-            result.append(file_path)
-
-    return result
-
-
-def _matches_ignore_pattern(file_path: str, pattern: str) -> bool:
-    # Convert pattern to absolute path if it starts with /
-    if pattern.startswith("/"):
-        pattern = pattern[1:]
-        # Match from the beginning of the path
-        return fnmatch.fnmatch(os.path.basename(file_path), pattern)
-
-    # Handle directory-specific patterns (ending with /)
-    if pattern.endswith("/"):
-        pattern = pattern[:-1]
-        return os.path.isdir(file_path) and fnmatch.fnmatch(
-            os.path.basename(file_path), pattern
-        )
-
-    # Handle patterns with wildcards
-    if "*" in pattern or "?" in pattern or "[" in pattern:
-        return fnmatch.fnmatch(os.path.basename(file_path), pattern)
-
-    # Handle exact matches
-    return os.path.basename(file_path) == pattern
+    logger.debug(f"Filtered {len(files)} files to {len(filtered_files)} files")
+    return filtered_files
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_patterns(patterns: T.Tuple[str, ...]) -> "re.Pattern":
+    # Combine the patterns into a single regex so each file is tested with
+    # one C-level match instead of one fnmatch call per pattern. Target nodes
+    # tend to share pattern lists, so the compiled regex is cached
+    return re.compile(
+        "|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in patterns)
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_ignore_patterns(
+    patterns: T.Tuple[str, ...]
+) -> T.Tuple[T.FrozenSet[str], T.Optional["re.Pattern"], T.Optional["re.Pattern"]]:
+    # Classify each pattern once instead of re-examining it per file:
+    # exact basenames go into a set, wildcard patterns into one combined
+    # regex, and directory-specific patterns (ending with /) into a second
+    # regex that is only consulted for directories
+    exact_names = set()
+    wildcard_patterns = []
+    dir_patterns = []
+
+    for pattern in patterns:
+        # A leading / anchors the pattern, which for basename matching is
+        # the same as the plain pattern
+        if pattern.startswith("/"):
+            pattern = pattern[1:]
+        elif pattern.endswith("/"):
+            dir_patterns.append(pattern[:-1])
+            continue
+
+        if "*" in pattern or "?" in pattern or "[" in pattern:
+            wildcard_patterns.append(pattern)
+        else:
+            exact_names.add(pattern)
+
+    wildcard_regex = (
+        _compile_patterns(tuple(wildcard_patterns)) if wildcard_patterns else None
+    )
+    dir_regex = _compile_patterns(tuple(dir_patterns)) if dir_patterns else None
+    return frozenset(exact_names), wildcard_regex, dir_regex
+
+
+def _matches_ignore_patterns(
+    file_path: str,
+    ignore_matchers: T.Tuple[
+        T.FrozenSet[str], T.Optional["re.Pattern"], T.Optional["re.Pattern"]
+    ],
+) -> bool:
+    exact_names, wildcard_regex, dir_regex = ignore_matchers
+    basename = os.path.basename(file_path)
+
+    if basename in exact_names:
+        return True
+    if wildcard_regex is not None and wildcard_regex.match(basename):
+        return True
+    if (
+        dir_regex is not None
+        and dir_regex.match(basename)
+        and os.path.isdir(file_path)
+    ):
+        return True
+    return False
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 import argparse
+import fnmatch
 import logging
 import os
-from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +60,23 @@ DEFAULT_EXCLUDE_PATTERNS = [
 ]
 
 
+def _iter_files(dirname, exclude_dirs):
+    # os.scandir classifies entries from the dirent type without an extra
+    # stat call per entry, unlike os.walk
+    subdirs = []
+    files = []
+    with os.scandir(dirname) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in exclude_dirs:
+                    subdirs.append(entry.path)
+            elif not entry.is_dir():
+                files.append(entry.path)
+    yield from sorted(files)
+    for subdir in subdirs:
+        yield from _iter_files(subdir, exclude_dirs)
+
+
 def concatenate_directory(
     dirname, output_file, exclude_dirs=None, exclude_patterns=None
 ):
@@ -78,56 +95,45 @@ def concatenate_directory(
     if exclude_patterns is None:
         exclude_patterns = DEFAULT_EXCLUDE_PATTERNS
 
-    root_path = Path(dirname).resolve()
+    root_path = os.path.realpath(dirname)
+    prefix_len = len(root_path) + 1
 
     with open(output_file, "w", encoding="utf-8") as outfile:
-        # Count total files for progress tracking
-        total_files = 0
+        # Walk the tree once; the list doubles as the progress total
+        all_files = list(_iter_files(root_path, exclude_dirs))
+        total_files = len(all_files)
         included_files = 0
 
-        # First pass to count files
-        for root, dirs, files in os.walk(root_path):
-            # Skip excluded directories
-            dirs[:] = [d for d in dirs if d not in exclude_dirs]
-            total_files += len(files)
-
         logger.info(f"Found {total_files} total files in {root_path}")
 
-        # Second pass to concatenate files
-        for root, dirs, files in os.walk(root_path):
-            # Skip excluded directories
-            dirs[:] = [d for d in dirs if d not in exclude_dirs]
-
-            # Process each file
-            for file in sorted(files):
-                file_path = Path(root) / file
-                rel_path = file_path.relative_to(root_path)
-
-                # Skip files matching exclude patterns
-                if any(file_path.match(pattern) for pattern in exclude_patterns):
-                    continue
-
-                # Try to read the file as text
-                try:
-                    with open(file_path, "r", encoding="utf-8") as infile:
-                        content = infile.read()
-
-                    # Write file header and content
-                    outfile.write(f"\n\n{'=' * 80}\n")
-                    outfile.write(f"=== FILE: {rel_path} ===\n")
-                    outfile.write(f"{'=' * 80}\n\n")
-                    outfile.write(content)
-
-                    included_files += 1
-                    if included_files % 10 == 0:
-                        logger.info(
-                            f"Processed {included_files}/{total_files} files..."
-                        )
-
-                except UnicodeDecodeError:
-                    logger.info(f"Skipping binary file: {rel_path}")
-                except Exception as e:
-                    logger.info(f"Error processing {rel_path}: {e}")
+        # Process each file
+        for file_path in all_files:
+            rel_path = file_path[prefix_len:]
+
+            # Skip files matching exclude patterns
+            basename = os.path.basename(file_path)
+            if any(fnmatch.fnmatch(basename, pattern) for pattern in exclude_patterns):
+                continue
+
+            # Try to read the file as text
+            try:
+                with open(file_path, "r", encoding="utf-8") as infile:
+                    content = infile.read()
+
+                # Write file header and content
+                outfile.write(f"\n\n{'=' * 80}\n")
+                outfile.write(f"=== FILE: {rel_path} ===\n")
+                outfile.write(f"{'=' * 80}\n\n")
+                outfile.write(content)
+
+                included_files += 1
+                if included_files % 10 == 0:
+                    logger.info(f"Processed {included_files}/{total_files} files...")
+
+            except UnicodeDecodeError:
+                logger.info(f"Skipping binary file: {rel_path}")
+            except Exception as e:
+                logger.info(f"Error processing {rel_path}: {e}")
 
     logger.info(f"\nConcatenation complete!")
     logger.info(
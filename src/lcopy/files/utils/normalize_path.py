@@ -1,7 +1,8 @@
+import functools
 import os
-import pathlib
 
 
+@functools.lru_cache(maxsize=8192)
 def normalize_path(rel_path: str, base_path: str = "") -> str:
     # Expand environment variables and user home directory
     expanded_rel = os.path.expandvars(os.path.expanduser(rel_path))
@@ -13,5 +14,6 @@ def normalize_path(rel_path: str, base_path: str = "") -> str:
     else:
         path = expanded_rel
 
-    # Convert to absolute path and normalize
-    return str(pathlib.Path(path).absolute().resolve())
+    # Convert to absolute path and normalize (resolving symlinks, as
+    # Path.absolute().resolve() did before)
+    return os.path.realpath(path)
@@ -7,17 +7,6 @@ import argparse
 import logging
 import sys
 
-from lcopy.configs.actions.create_target_nodes import create_target_nodes
-from lcopy.configs.actions.parse_config_file import parse_config_file
-from lcopy.configs.rules.get_list_of_labels import get_list_of_labels
-from lcopy.configs.rules.transform_targets_json import transform_targets_json
-from lcopy.configs.utils.print_target_nodes import print_target_nodes
-from lcopy.files.actions.copy_files import copy_files
-from lcopy.files.actions.create_concatenated_output import create_concatenated_output
-from lcopy.files.actions.purge_files import purge_files
-from lcopy.files.utils.normalize_path import normalize_path
-from lcopy.runtime.rules.get_ignore_patterns import get_ignore_patterns
-
 logger = logging.getLogger(__name__)
 
 
@@ -50,6 +39,12 @@ def _parse_args():
         action="store_true",
         help="Debug option to print target nodes",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker threads used to copy files",
+    )
 
     # Global arguments
     parser.add_argument(
@@ -75,6 +70,10 @@ def main():
     args = _parse_args()
     _setup_logging(args.verbose)
 
+    # Imports are deferred until after argument parsing so that commands only
+    # pay for the modules they actually use
+    from lcopy.configs.actions.parse_config_file import parse_config_file
+
     # Parse the config file
     config = parse_config_file(config_file=args.config_file)
 
@@ -85,6 +84,8 @@ def main():
     if args.list_labels:
         logger.info("Running listlabels command")
 
+        from lcopy.configs.rules.get_list_of_labels import get_list_of_labels
+
         # Get all labels from the config file
         all_labels = get_list_of_labels(args.config_file)
 
@@ -97,6 +98,17 @@ def main():
 
     logger.info("Running copy command")
 
+    from lcopy.configs.actions.create_target_nodes import create_target_nodes
+    from lcopy.configs.rules.transform_targets_json import transform_targets_json
+    from lcopy.configs.utils.print_target_nodes import print_target_nodes
+    from lcopy.files.actions.copy_files import copy_files
+    from lcopy.files.actions.create_concatenated_output import (
+        create_concatenated_output,
+    )
+    from lcopy.files.actions.purge_files import purge_files
+    from lcopy.files.utils.normalize_path import normalize_path
+    from lcopy.runtime.rules.get_ignore_patterns import get_ignore_patterns
+
     # Override dry_run option from command line if specified
     dry_run = config.options.dry_run if config.options else False
     if hasattr(args, "dry_run") and args.dry_run:
@@ -149,6 +161,7 @@ def main():
         target_nodes=target_nodes,
         overwrite=conflict,
         dry_run=dry_run,
+        workers=args.workers,
     )
 
     # Purge files if enabled